@@ -1,5 +1,4 @@
 """SceneValidator - Media scene validation tool."""
 
-from .validator import SceneValidator
-
-__version__ = '0.1.0'
+from .__version__ import __version__
+from .validator import QueueFullError, SceneValidator, validate_batch
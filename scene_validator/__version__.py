@@ -0,0 +1,3 @@
+"""Version of the SceneValidator package."""
+
+__version__ = '0.1.0'
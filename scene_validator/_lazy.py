@@ -0,0 +1,77 @@
+"""Deferred imports of heavy and optional dependencies of SceneValidator.
+
+The Google Cloud, Gemini, ffmpeg and numpy libraries are expensive to
+import and are only needed once a validation actually runs, so they are
+imported on first use rather than when scene_validator is imported. Python
+caches the imported modules, so repeated calls are cheap.
+"""
+
+import shutil
+import importlib
+from types import ModuleType
+
+# Set once the ffmpeg and ffprobe binaries have been found on PATH
+_ffmpeg_binaries_found = False
+
+def _import_optional(name: str, package: str, extra: str) -> ModuleType:
+    """Import a module provided by an optional extra.
+    
+    Args:
+        name: Module to import
+        package: Name of the distribution that provides the module
+        extra: Name of the scene_validator extra that installs the package
+        
+    Returns:
+        The imported module
+        
+    Raises:
+        ImportError: If the module is not installed
+    """
+    try:
+        return importlib.import_module(name)
+    except ImportError as e:
+        raise ImportError(
+            f"{package} is required for this feature. "
+            f"Install it with: pip install 'scene_validator[{extra}]'"
+        ) from e
+
+def load_genai() -> ModuleType:
+    """Import google.generativeai."""
+    return _import_optional('google.generativeai', 'google-generativeai', 'genai')
+
+def load_storage() -> ModuleType:
+    """Import google.cloud.storage."""
+    return _import_optional('google.cloud.storage', 'google-cloud-storage', 'gcp')
+
+def load_transfer_manager() -> ModuleType:
+    """Import google.cloud.storage.transfer_manager."""
+    return _import_optional('google.cloud.storage.transfer_manager', 'google-cloud-storage', 'gcp')
+
+def load_firestore() -> ModuleType:
+    """Import google.cloud.firestore."""
+    return _import_optional('google.cloud.firestore', 'google-cloud-firestore', 'gcp')
+
+def load_numpy() -> ModuleType:
+    """Import numpy."""
+    return _import_optional('numpy', 'numpy', 'batch')
+
+def load_ffmpeg() -> ModuleType:
+    """Import the ffmpeg-python bindings, checking once that the ffmpeg binaries are installed.
+    
+    Raises:
+        ImportError: If ffmpeg-python is not installed
+        RuntimeError: If the ffmpeg or ffprobe binary is not on PATH
+    """
+    global _ffmpeg_binaries_found
+    ffmpeg = _import_optional('ffmpeg', 'ffmpeg-python', 'video')
+    
+    if not _ffmpeg_binaries_found:
+        missing = [binary for binary in ('ffmpeg', 'ffprobe') if shutil.which(binary) is None]
+        if missing:
+            raise RuntimeError(
+                f"{' and '.join(missing)} not found on PATH. "
+                "Install ffmpeg (e.g. apt-get install ffmpeg) to process video."
+            )
+        _ffmpeg_binaries_found = True
+    
+    return ffmpeg
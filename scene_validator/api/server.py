@@ -1,16 +1,20 @@
 """Flask REST API server for SceneValidator."""
 
-import os
-import json
+import time
+import hashlib
 import logging
-from functools import wraps
-from datetime import datetime, timedelta
+import threading
+from functools import lru_cache, wraps
 from typing import Dict, Any, Callable, Optional
 
-from flask import Flask, request, jsonify, g
+from flask import Flask, Response, request, jsonify, g
+from flask.json.provider import JSONProvider, DefaultJSONProvider
 import jwt
+import orjson
+from cachetools import TTLCache
 
-from ..validator import SceneValidator
+from ..__version__ import __version__
+from ..validator import QueueFullError, SceneValidator
 from ..utils.config import load_config
 
 # Configure logging
@@ -19,12 +23,94 @@ logger = logging.getLogger(__name__)
 # Load configuration
 config = load_config()
 
+class ORJSONProvider(JSONProvider):
+    """Flask JSON provider backed by orjson."""
+    
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialize data as JSON, falling back to Flask's handling for unsupported types."""
+        return orjson.dumps(obj, default=DefaultJSONProvider.default, option=self.option).decode()
+    
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        """Deserialize data as JSON."""
+        return orjson.loads(s)
+    
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        """Serialize data as a JSON response, passing orjson's bytes straight to the body."""
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=DefaultJSONProvider.default, option=self.option)
+        return self._app.response_class(body, mimetype='application/json')
+
 # Initialize Flask app
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 app.config['SECRET_KEY'] = config['SECRET_KEY']
 
-# Initialize SceneValidator
-validator = SceneValidator()
+# SceneValidator is created on first use so that importing the app opens no client connections
+_validator: Optional[SceneValidator] = None
+_validator_lock = threading.Lock()
+
+def get_validator() -> SceneValidator:
+    """Return the process-wide SceneValidator, creating it on first use."""
+    global _validator
+    with _validator_lock:
+        if _validator is None:
+            _validator = SceneValidator()
+        return _validator
+
+def shutdown_validator(timeout: Optional[float] = None) -> None:
+    """Drain the validation queue of this process, if a SceneValidator was created."""
+    with _validator_lock:
+        validator = _validator
+    
+    if validator is not None:
+        validator.shutdown(timeout)
+
+# Decoded JWT payloads keyed by token hash, so signatures are verified once per token
+_JWT_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=300)
+_JWT_CACHE_LOCK = threading.Lock()
+
+# Validation documents that reached a final status and will no longer change
+_VALIDATION_CACHE: TTLCache = TTLCache(maxsize=1024, ttl=300)
+_VALIDATION_CACHE_LOCK = threading.Lock()
+_FINAL_VALIDATION_STATUSES = frozenset({'passed', 'failed', 'error'})
+
+# Serialized /profiles response body; profiles change rarely
+_PROFILES_RESPONSE_CACHE: TTLCache = TTLCache(maxsize=1, ttl=30)
+_PROFILES_RESPONSE_CACHE_LOCK = threading.Lock()
+
+def _decode_token(token: str) -> Dict[str, Any]:
+    """Decode and verify a JWT, reusing previously verified payloads.
+    
+    Args:
+        token: Encoded bearer token
+        
+    Returns:
+        Decoded token payload
+        
+    Raises:
+        jwt.InvalidTokenError: If the token is invalid or has expired
+    """
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    
+    with _JWT_CACHE_LOCK:
+        cached = _JWT_CACHE.get(key)
+    
+    if cached is not None:
+        payload, expires_at = cached
+        if expires_at is None or expires_at > time.time():
+            return payload
+        with _JWT_CACHE_LOCK:
+            _JWT_CACHE.pop(key, None)
+        raise jwt.ExpiredSignatureError('Signature has expired')
+    
+    # Only successfully verified tokens are cached
+    payload = jwt.decode(token, app.config['SECRET_KEY'], algorithms=['HS256'])
+    with _JWT_CACHE_LOCK:
+        _JWT_CACHE[key] = (payload, payload.get('exp'))
+    
+    return payload
 
 # Authentication decorator
 def token_required(f: Callable) -> Callable:
@@ -43,7 +129,7 @@ def token_required(f: Callable) -> Callable:
             
         try:
             # Decode token
-            data = jwt.decode(token, app.config['SECRET_KEY'], algorithms=['HS256'])
+            data = _decode_token(token)
             g.user_id = data['user_id']
         except jwt.ExpiredSignatureError:
             return jsonify({'error': 'Token has expired'}), 401
@@ -54,20 +140,25 @@ def token_required(f: Callable) -> Callable:
     
     return decorated
 
+@lru_cache(maxsize=1)
+def _iso_timestamp(epoch_seconds: int) -> str:
+    """Format a whole-second UTC timestamp, reusing the result within the same second."""
+    return time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(epoch_seconds))
+
 # API Routes
 @app.route('/health', methods=['GET'])
 def health_check() -> tuple:
     """Health check endpoint."""
     return jsonify({
         'status': 'ok',
-        'version': '0.1.0',
-        'timestamp': datetime.utcnow().isoformat() + 'Z'
+        'version': __version__,
+        'timestamp': _iso_timestamp(int(time.time()))
     }), 200
 
 @app.route('/validate', methods=['POST'])
 @token_required
 def validate_scene() -> tuple:
-    """Endpoint to validate a media scene."""
+    """Endpoint to queue validation of a media scene."""
     data = request.json
     
     # Validate request data
@@ -79,9 +170,16 @@ def validate_scene() -> tuple:
             'error': f"Missing required fields: {', '.join(missing_fields)}"
         }), 400
     
+    # Configuration problems (e.g. a missing Gemini API key) are server errors, not bad requests
     try:
-        # Call validator
-        result = validator.validate(
+        validator = get_validator()
+    except Exception as e:
+        logger.exception(f"Failed to initialize SceneValidator: {str(e)}")
+        return jsonify({'error': 'Validation service unavailable'}), 503
+    
+    try:
+        # Queue the validation; results are available via /validation/<validation_id>
+        job = validator.submit(
             scene_id=data['scene_id'],
             media_url=data['media_url'],
             validation_profile=data['validation_profile'],
@@ -90,9 +188,11 @@ def validate_scene() -> tuple:
             callback_url=data.get('callback_url')
         )
         
-        return jsonify(result), 200
+        return jsonify(job), 202
     except ValueError as e:
         return jsonify({'error': str(e)}), 400
+    except QueueFullError as e:
+        return jsonify({'error': str(e)}), 503, {'Retry-After': '30'}
     except Exception as e:
         logger.exception(f"Error during validation: {str(e)}")
         return jsonify({'error': 'Internal server error'}), 500
@@ -101,14 +201,27 @@ def validate_scene() -> tuple:
 @token_required
 def get_validation_result(validation_id: str) -> tuple:
     """Endpoint to retrieve validation results."""
+    with _VALIDATION_CACHE_LOCK:
+        validation = _VALIDATION_CACHE.get(validation_id)
+    
+    if validation is not None:
+        return jsonify(validation), 200
+    
     try:
         # Get validation from Firestore
-        validation_doc = validator.db.collection(config['FIRESTORE_COLLECTION_VALIDATIONS']).document(validation_id).get()
+        validation_doc = get_validator().db.collection(config['FIRESTORE_COLLECTION_VALIDATIONS']).document(validation_id).get()
         
         if not validation_doc.exists:
             return jsonify({'error': f"Validation with ID {validation_id} not found"}), 404
+        
+        validation = validation_doc.to_dict()
+        
+        # Only cache validations that are finished; in-progress ones are still being updated
+        if validation.get('status') in _FINAL_VALIDATION_STATUSES:
+            with _VALIDATION_CACHE_LOCK:
+                _VALIDATION_CACHE[validation_id] = validation
             
-        return jsonify(validation_doc.to_dict()), 200
+        return jsonify(validation), 200
     except Exception as e:
         logger.exception(f"Error retrieving validation {validation_id}: {str(e)}")
         return jsonify({'error': 'Internal server error'}), 500
@@ -117,24 +230,40 @@ def get_validation_result(validation_id: str) -> tuple:
 @token_required
 def list_validation_profiles() -> tuple:
     """Endpoint to list available validation profiles."""
+    with _PROFILES_RESPONSE_CACHE_LOCK:
+        body = _PROFILES_RESPONSE_CACHE.get('profiles')
+    
+    if body is not None:
+        return Response(body, mimetype='application/json'), 200
+    
     try:
-        # Get profiles from Firestore
+        # Get profiles from Firestore in a single query, fetching only the listed fields
         profiles = []
-        for doc in validator.db.collection(config['FIRESTORE_COLLECTION_PROFILES']).stream():
+        query = get_validator().db.collection(config['FIRESTORE_COLLECTION_PROFILES']).select(['name', 'description'])
+        for doc in query.stream():
             profile_data = doc.to_dict()
             profiles.append({
                 'id': doc.id,
                 'name': profile_data.get('name', 'Unnamed Profile'),
                 'description': profile_data.get('description', '')
             })
+        
+        body = orjson.dumps({'profiles': profiles})
+        with _PROFILES_RESPONSE_CACHE_LOCK:
+            _PROFILES_RESPONSE_CACHE['profiles'] = body
             
-        return jsonify({'profiles': profiles}), 200
+        return Response(body, mimetype='application/json'), 200
     except Exception as e:
         logger.exception(f"Error listing validation profiles: {str(e)}")
         return jsonify({'error': 'Internal server error'}), 500
 
-# Main entry point
+# Main entry point (development only; use scene_validator.wsgi:app with gunicorn in production)
 if __name__ == '__main__':
+    logger.warning(
+        "Running the Flask development server, which handles one request at a time. "
+        "For production use the scene-validator command or: "
+        "gunicorn -c python:scene_validator.gunicorn_conf scene_validator.wsgi:app"
+    )
     app.run(
         host=config['API_HOST'],
         port=config['API_PORT'],
@@ -0,0 +1,14 @@
+"""ASGI entry point for serving SceneValidator with uvicorn.
+
+Run with:
+
+    uvicorn scene_validator.asgi:app --workers 4
+"""
+
+from asgiref.wsgi import WsgiToAsgi
+
+from .api.server import app as wsgi_app
+
+app = WsgiToAsgi(wsgi_app)
+
+__all__ = ['app']
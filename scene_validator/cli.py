@@ -0,0 +1,34 @@
+"""Command-line entry points for SceneValidator."""
+
+import os
+import sys
+
+def main() -> None:
+    """Serve the API with gunicorn using the packaged configuration.
+    
+    Any command-line arguments are passed through to gunicorn.
+    """
+    from gunicorn.app.wsgiapp import run
+    
+    sys.argv = [
+        sys.argv[0],
+        '-c', 'python:scene_validator.gunicorn_conf',
+        *sys.argv[1:],
+        'scene_validator.wsgi:app',
+    ]
+    sys.exit(run())
+
+def asgi_main() -> None:
+    """Serve the API with uvicorn through the ASGI adapter."""
+    import uvicorn
+    from dotenv import load_dotenv
+    
+    # Honor a .env file for these settings as the app itself does
+    load_dotenv()
+    
+    uvicorn.run(
+        'scene_validator.asgi:app',
+        host=os.environ.get('API_HOST', '0.0.0.0'),
+        port=int(os.environ.get('API_PORT', 5000)),
+        workers=int(os.environ.get('UVICORN_WORKERS', 4))
+    )
@@ -0,0 +1,80 @@
+"""Process-wide Google Cloud and Gemini clients for SceneValidator.
+
+Each client holds long-lived gRPC/HTTP connections and is safe to share
+between threads, so one instance per process is reused for all requests.
+gRPC channels do not survive fork(), so under a preloading server the
+clients must be created in each worker after it forks (see init()).
+"""
+
+import threading
+from typing import TYPE_CHECKING, Dict, Optional
+
+from . import _lazy
+from .utils.config import load_config
+
+if TYPE_CHECKING:
+    import google.generativeai as _genai
+    from google.cloud import firestore as _firestore
+    from google.cloud import storage as _storage
+
+_storage_client: Optional['_storage.Client'] = None
+_firestore_client: Optional['_firestore.Client'] = None
+_gemini_api_key: Optional[str] = None
+_gemini_models: Dict[str, '_genai.GenerativeModel'] = {}
+_lock = threading.Lock()
+
+def storage() -> '_storage.Client':
+    """Return the shared Cloud Storage client, creating it on first use."""
+    global _storage_client
+    with _lock:
+        if _storage_client is None:
+            _storage_client = _lazy.load_storage().Client()
+        return _storage_client
+
+def firestore() -> '_firestore.Client':
+    """Return the shared Firestore client, creating it on first use."""
+    global _firestore_client
+    with _lock:
+        if _firestore_client is None:
+            _firestore_client = _lazy.load_firestore().Client()
+        return _firestore_client
+
+def gemini(api_key: str, model_name: str) -> '_genai.GenerativeModel':
+    """Return the shared Gemini model with the given name, creating it on first use.
+    
+    genai.configure sets the API key for the whole process, so the first
+    key used configures every model and a different key is rejected rather
+    than silently switching the models already handed out.
+    
+    Args:
+        api_key: Gemini API key
+        model_name: Name of the Gemini model
+        
+    Returns:
+        Shared GenerativeModel
+        
+    Raises:
+        ValueError: If Gemini is already configured with a different API key
+    """
+    global _gemini_api_key
+    with _lock:
+        genai = _lazy.load_genai()
+        if _gemini_api_key is None:
+            genai.configure(api_key=api_key)
+            _gemini_api_key = api_key
+        elif api_key != _gemini_api_key:
+            raise ValueError("Gemini is already configured with a different API key in this process")
+        
+        model = _gemini_models.get(model_name)
+        if model is None:
+            model = _gemini_models[model_name] = genai.GenerativeModel(model_name)
+        return model
+
+def init() -> None:
+    """Create all clients up front, e.g. from a server's post-fork hook."""
+    storage()
+    firestore()
+    
+    config = load_config()
+    if config['GEMINI_API_KEY']:
+        gemini(config['GEMINI_API_KEY'], config['GEMINI_MODEL'])
@@ -0,0 +1,62 @@
+"""Gunicorn configuration for the SceneValidator API server.
+
+Use with:
+
+    gunicorn -c python:scene_validator.gunicorn_conf scene_validator.wsgi:app
+
+Settings can be overridden with GUNICORN_* environment variables.
+"""
+
+import os
+import multiprocessing
+
+from dotenv import load_dotenv
+
+# Honor a .env file for these settings as the app itself does
+load_dotenv()
+
+bind = f"{os.environ.get('API_HOST', '0.0.0.0')}:{os.environ.get('API_PORT', '5000')}"
+
+# Threaded workers overlap the time requests spend waiting on Gemini, Firestore and GCS
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'gthread')
+workers = int(os.environ.get('GUNICORN_WORKERS', min(2 * multiprocessing.cpu_count() + 1, 16)))
+threads = int(os.environ.get('GUNICORN_THREADS', 5))
+
+# Import the app once in the master so workers share its pages copy-on-write.
+# gevent must patch the standard library before the app is imported, so it is
+# not preloaded by default when using gevent workers.
+preload_app = os.environ.get('GUNICORN_PRELOAD_APP', str(worker_class != 'gevent')).lower() == 'true'
+
+# Seconds a stopping worker gets before it is killed; half is spent letting queued validations finish
+graceful_timeout = int(os.environ.get('GUNICORN_GRACEFUL_TIMEOUT', 60))
+
+# Recycle workers periodically to bound memory growth
+max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS', 100000))
+max_requests_jitter = int(os.environ.get('GUNICORN_MAX_REQUESTS_JITTER', 100))
+
+def post_worker_init(worker):
+    """Create the Google Cloud and Gemini clients in each worker, since gRPC channels do not survive fork().
+    
+    This runs after gevent workers have patched the standard library; importing
+    scene_validator any earlier (e.g. in post_fork) would create its locks and
+    thread pools unpatched.
+    """
+    from scene_validator import clients
+    
+    try:
+        clients.init()
+    except Exception as e:
+        # Clients are created lazily on first use anyway; surface the problem without killing the worker
+        worker.log.warning(f"Failed to initialize clients in worker {worker.pid}: {e}")
+
+def worker_int(worker):
+    """Mark unfinished validations as failed when a worker is told to quit immediately."""
+    from scene_validator.api.server import shutdown_validator
+    
+    shutdown_validator(timeout=0)
+
+def worker_exit(server, worker):
+    """Let queued validations finish before the worker exits, marking any left over as failed."""
+    from scene_validator.api.server import shutdown_validator
+    
+    shutdown_validator(timeout=graceful_timeout / 2)
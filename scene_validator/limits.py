@@ -0,0 +1,11 @@
+"""Process-wide limits on outbound calls made by SceneValidator."""
+
+import os
+import threading
+
+# Caps the number of in-flight calls to Gemini, Cloud Storage and other
+# external HTTP endpoints per process, so that bursts of validations queue
+# locally instead of exhausting file descriptors or triggering provider 429s
+OUTBOUND_CONCURRENCY = int(os.environ.get('SCENE_VALIDATOR_OUTBOUND_CONCURRENCY', 32))
+
+outbound = threading.BoundedSemaphore(OUTBOUND_CONCURRENCY)
@@ -40,10 +40,16 @@ def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
         # Gemini API
         'GEMINI_API_KEY': os.environ.get('GEMINI_API_KEY'),
         'GEMINI_MODEL': os.environ.get('GEMINI_MODEL', 'gemini-1.5-pro-latest'),
+        'GEMINI_CACHE_TTL_DAYS': int(os.environ.get('GEMINI_CACHE_TTL_DAYS', 7)),
+        
+        # Background validation
+        'VALIDATION_WORKERS': int(os.environ.get('VALIDATION_WORKERS', 4)),
+        'VALIDATION_QUEUE_SIZE': int(os.environ.get('VALIDATION_QUEUE_SIZE', 100)),
         
         # Firestore
         'FIRESTORE_COLLECTION_VALIDATIONS': os.environ.get('FIRESTORE_COLLECTION_VALIDATIONS', 'scene_validations'),
         'FIRESTORE_COLLECTION_PROFILES': os.environ.get('FIRESTORE_COLLECTION_PROFILES', 'validation_profiles'),
+        'FIRESTORE_COLLECTION_GEMINI_CACHE': os.environ.get('FIRESTORE_COLLECTION_GEMINI_CACHE', 'gemini_cache'),
         
         # Logging
         'LOG_LEVEL': os.environ.get('LOG_LEVEL', 'INFO'),
@@ -0,0 +1,36 @@
+"""HTTP utilities for SceneValidator."""
+
+import logging
+import threading
+from typing import Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Default timeouts in seconds for outbound requests
+DEFAULT_TIMEOUT = httpx.Timeout(10.0, connect=3.05)
+
+_client: Optional[httpx.Client] = None
+_client_lock = threading.Lock()
+
+def get_client() -> httpx.Client:
+    """Return the process-wide HTTP client, creating it on first use.
+    
+    The client keeps connections alive between requests, multiplexes
+    requests to the same host over HTTP/2 where the server supports it,
+    and retries failed connection attempts.
+    
+    Returns:
+        Shared httpx client
+    """
+    global _client
+    with _client_lock:
+        if _client is None:
+            transport = httpx.HTTPTransport(
+                http2=True,
+                retries=3,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+            )
+            _client = httpx.Client(transport=transport, timeout=DEFAULT_TIMEOUT, follow_redirects=True)
+        return _client
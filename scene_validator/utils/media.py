@@ -4,21 +4,60 @@ import os
 import uuid
 import tempfile
 import logging
-from typing import Dict, List, Any, Optional, Union
+from typing import TYPE_CHECKING, Dict, List, Any, Optional
+from urllib.parse import urlparse
 
-import ffmpeg
-import numpy as np
-import cv2
-from google.cloud import storage
+import httpx
+
+from .http import get_client
+from .. import _lazy, clients, limits
+
+if TYPE_CHECKING:
+    from google.cloud import storage
 
 logger = logging.getLogger(__name__)
 
+# GCS objects larger than this are downloaded with parallel ranged requests
+_CONCURRENT_DOWNLOAD_THRESHOLD = 32 * 1024 * 1024
+_DOWNLOAD_CHUNK_SIZE = 16 * 1024 * 1024
+_DOWNLOAD_MAX_WORKERS = 8
+
+# HTTP media is streamed to disk; only streaming manifests still go through ffmpeg
+_STREAMING_MANIFEST_SUFFIXES = ('.m3u8', '.mpd')
+_MEDIA_DOWNLOAD_TIMEOUT = httpx.Timeout(300.0, connect=5.0)
+_HTTP_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Key frames are downscaled to fit this size and encoded at a moderate JPEG
+# quality (ffmpeg qscale, 2-31, lower is better; 5 is roughly quality 75)
+_FRAME_MAX_DIMENSION = 1024
+_FRAME_JPEG_QSCALE = 5
+
+# Seconds of video read after each key frame timestamp when looking for the frame
+_FRAME_SEEK_WINDOW = 2.0
+
+# JPEG start-of-image marker followed by the first segment marker byte
+_JPEG_SOI = b'\xff\xd8\xff'
+
+def _split_jpeg_stream(data: bytes) -> List[bytes]:
+    """Split concatenated JPEG images (ffmpeg image2pipe output) into individual images."""
+    frames = []
+    start = data.find(_JPEG_SOI)
+    while start != -1:
+        end = data.find(_JPEG_SOI, start + len(_JPEG_SOI))
+        frames.append(data[start:end if end != -1 else len(data)])
+        start = end
+    return frames
+
 class MediaProcessor:
     """Class for processing media files."""
     
-    def __init__(self):
-        """Initialize the MediaProcessor."""
-        self.storage_client = storage.Client()
+    def __init__(self, storage_client: Optional['storage.Client'] = None):
+        """Initialize the MediaProcessor.
+        
+        Args:
+            storage_client: GCS client to use (defaults to the shared process-wide client)
+        """
+        self.storage_client = storage_client or clients.storage()
         self.temp_dir = tempfile.gettempdir()
     
     def download_media(self, media_url: str) -> str:
@@ -39,21 +78,43 @@ class MediaProcessor:
             bucket_name = media_url.split('/')[2]
             blob_path = '/'.join(media_url.split('/')[3:])
             
-            # Download from GCS
-            bucket = self.storage_client.bucket(bucket_name)
-            blob = bucket.blob(blob_path)
-            blob.download_to_filename(local_path)
-        else:
-            # Assume HTTP URL - use ffmpeg to download
+            # Download from GCS, fetching object metadata first to choose a strategy
+            blob = self.storage_client.bucket(bucket_name).get_blob(blob_path)
+            if blob is None:
+                raise ValueError(f"Media not found at {media_url}")
+            
+            with limits.outbound:
+                if blob.size and blob.size > _CONCURRENT_DOWNLOAD_THRESHOLD:
+                    transfer_manager = _lazy.load_transfer_manager()
+                    transfer_manager.download_chunks_concurrently(
+                        blob,
+                        local_path,
+                        chunk_size=_DOWNLOAD_CHUNK_SIZE,
+                        max_workers=_DOWNLOAD_MAX_WORKERS,
+                        worker_type=transfer_manager.THREAD
+                    )
+                else:
+                    blob.download_to_filename(local_path)
+        elif urlparse(media_url).path.lower().endswith(_STREAMING_MANIFEST_SUFFIXES):
+            # HLS/DASH manifest - use ffmpeg to fetch and remux the segments
+            ffmpeg = _lazy.load_ffmpeg()
             try:
-                (ffmpeg
-                    .input(media_url)
-                    .output(local_path, c='copy')
-                    .run(capture_stdout=True, capture_stderr=True, overwrite_output=True)
-                )
+                with limits.outbound:
+                    (ffmpeg
+                        .input(media_url)
+                        .output(local_path, c='copy')
+                        .run(capture_stdout=True, capture_stderr=True, overwrite_output=True)
+                    )
             except ffmpeg.Error as e:
                 logger.error(f"Failed to download media from {media_url}: {e.stderr.decode()}")
                 raise
+        else:
+            # Plain HTTP URL - stream the file straight to disk over the shared client
+            with limits.outbound, get_client().stream('GET', media_url, timeout=_MEDIA_DOWNLOAD_TIMEOUT) as response:
+                response.raise_for_status()
+                with open(local_path, 'wb') as f:
+                    for chunk in response.iter_bytes(_HTTP_DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
         
         logger.info(f"Media downloaded to {local_path}")
         return local_path
@@ -68,6 +129,7 @@ class MediaProcessor:
             Dictionary of technical metadata
         """
         logger.info(f"Extracting metadata from {file_path}")
+        ffmpeg = _lazy.load_ffmpeg()
         
         try:
             # Use ffprobe to get metadata
@@ -107,44 +169,56 @@ class MediaProcessor:
             logger.error(f"Failed to extract metadata from {file_path}: {str(e)}")
             raise
     
-    def extract_key_frames(self, file_path: str, num_frames: int = 5) -> List[bytes]:
+    def extract_key_frames(self, file_path: str, duration: float, num_frames: int = 5) -> List[bytes]:
         """Extract key frames from video for content analysis.
         
+        A single ffmpeg process opens the file once per frame, seeking each
+        input straight to its timestamp and decoding only the frame there,
+        and encodes all of them as JPEG.
+        
         Args:
             file_path: Path to local video file
+            duration: Duration of the video in seconds, as reported by extract_metadata
             num_frames: Number of frames to extract
             
         Returns:
             List of frame images as bytes
         """
         logger.info(f"Extracting {num_frames} key frames from {file_path}")
+        ffmpeg = _lazy.load_ffmpeg()
         
-        # Get video metadata
-        metadata = self.extract_metadata(file_path)
-        duration = metadata['duration']
+        # Take frames from the middle of evenly sized segments, so every timestamp is before the end of the stream
+        timestamps = [duration * (i + 0.5) / num_frames for i in range(num_frames)]
         
-        # Calculate timestamps for evenly distributed frames
-        timestamps = [duration * i / (num_frames - 1) if num_frames > 1 else duration / 2 for i in range(num_frames)]
+        # Seek each input before decoding, read at most a short window after the timestamp
+        # and keep only its first frame
+        frames_in = [
+            ffmpeg.input(file_path, ss=ts, t=_FRAME_SEEK_WINDOW).video
+                .filter('trim', end_frame=1)
+                .filter('scale',
+                        w=f'min({_FRAME_MAX_DIMENSION},iw)',
+                        h=f'min({_FRAME_MAX_DIMENSION},ih)',
+                        force_original_aspect_ratio='decrease')
+            for ts in timestamps
+        ]
         
-        # Extract frames using OpenCV
-        frames = []
-        cap = cv2.VideoCapture(file_path)
+        try:
+            out, _ = (ffmpeg
+                .concat(*frames_in, v=1, a=0)
+                # Each one-frame segment has zero duration, so concat stamps every frame 0; renumber them
+                .filter('setpts', 'N/TB')
+                .output('pipe:', format='image2pipe', vcodec='mjpeg', vsync='vfr', vframes=len(timestamps),
+                        **{'q:v': _FRAME_JPEG_QSCALE})
+                .run(capture_stdout=True, capture_stderr=True)
+            )
+        except ffmpeg.Error as e:
+            logger.error(f"Failed to extract frames from {file_path}: {e.stderr.decode()}")
+            raise
         
-        for ts in timestamps:
-            # Set position to timestamp
-            cap.set(cv2.CAP_PROP_POS_MSEC, ts * 1000)
-            
-            # Read frame
-            ret, frame = cap.read()
-            if not ret:
-                logger.warning(f"Failed to read frame at timestamp {ts}s")
-                continue
-                
-            # Convert to JPEG bytes
-            _, buffer = cv2.imencode('.jpg', frame)
-            frames.append(buffer.tobytes())
+        frames = _split_jpeg_stream(out)
+        if len(frames) < len(timestamps):
+            logger.warning(f"Only {len(frames)} of {len(timestamps)} frames could be read from {file_path}")
         
-        cap.release()
         logger.info(f"Extracted {len(frames)} frames from {file_path}")
         
         return frames
@@ -1,21 +1,161 @@
 """Core SceneValidator implementation."""
 
 import os
-import json
+import re
+import hashlib
 import logging
 import uuid
-from datetime import datetime
-from typing import Dict, List, Any, Optional, Union
-
-import requests
-import google.generativeai as genai
-from google.cloud import storage, firestore
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Any, Optional, Set, Tuple
 
+import orjson
+from cachetools import TTLCache
+from . import _lazy, clients, limits
 from .utils.media import MediaProcessor
 from .utils.config import load_config
+from .utils.http import get_client
 
 logger = logging.getLogger(__name__)
 
+# Fenced code block in Gemini responses, optionally tagged as JSON
+_FENCE_RE = re.compile(r'```(?:json)?\s*([\s\S]*?)```')
+
+def _extract_json(response_text: str) -> Any:
+    """Parse the JSON payload of a Gemini response, which may be wrapped in a markdown code block."""
+    match = _FENCE_RE.search(response_text)
+    json_str = match.group(1).strip() if match else response_text.strip()
+    return orjson.loads(json_str)
+
+@dataclass(frozen=True)
+class TechnicalRequirements:
+    """Technical specifications a scene is validated against, parsed once per validation."""
+    
+    resolution: Optional[Tuple[int, int]] = None
+    framerate: Optional[float] = None
+    audio_channels: Optional[int] = None
+    audio_sample_rate: Optional[int] = None
+    
+    @classmethod
+    def from_dict(cls, requirements: Dict[str, Any]) -> 'TechnicalRequirements':
+        """Build requirements from the request format, e.g. {'resolution': '1920x1080', 'framerate': 29.97}."""
+        resolution = None
+        if 'resolution' in requirements:
+            width, height = map(int, requirements['resolution'].split('x'))
+            resolution = (width, height)
+        
+        return cls(
+            resolution=resolution,
+            framerate=requirements.get('framerate'),
+            audio_channels=requirements.get('audio_channels'),
+            audio_sample_rate=requirements.get('audio_sample_rate')
+        )
+
+# Technical checks as (property, description label, severity, allowed tolerance)
+_TECHNICAL_CHECKS = (
+    ('resolution', 'Resolution', 'high', 0),
+    ('framerate', 'Framerate', 'high', 0.01),  # Allow small tolerance
+    ('audio_channels', 'Audio channels', 'medium', 0),
+    ('audio_sample_rate', 'Audio sample rate', 'medium', 0),
+)
+
+def _technical_value(tech_metadata: Dict[str, Any], prop: str) -> Any:
+    """Look up the value of a technical property in scene metadata, or None if it is missing."""
+    if prop == 'resolution':
+        width, height = tech_metadata.get('width'), tech_metadata.get('height')
+        return (width, height) if width is not None and height is not None else None
+    return tech_metadata.get(prop)
+
+def _format_technical_value(value: Any) -> str:
+    """Format a technical property value for issue descriptions."""
+    if value is None:
+        return 'unknown'
+    if isinstance(value, tuple):
+        return 'x'.join(str(v) for v in value)
+    return str(value)
+
+def _technical_issue(prop: str, label: str, severity: str, actual: Any, expected: Any) -> Dict[str, Any]:
+    """Build the issue reported for a technical property that does not meet its requirement."""
+    return {
+        'type': f'{prop}_mismatch',
+        'description': f"{label} {_format_technical_value(actual)} does not match required {_format_technical_value(expected)}",
+        'severity': severity,
+        'property': prop
+    }
+
+def validate_batch(scene_metadatas: List[Dict[str, Any]], requirements: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Validate the technical metadata of many scenes against the same requirements.
+    
+    Gives the same per-scene results as the technical validation done by
+    SceneValidator.validate, but compares all scenes at once with vectorized
+    array operations. Intended for bulk re-validation, e.g. checking a whole
+    catalogue against a new set of requirements.
+    
+    Args:
+        scene_metadatas: Technical metadata per scene, as returned by MediaProcessor.extract_metadata
+        requirements: Technical specifications for validation
+        
+    Returns:
+        List of technical validation results, in the same order as scene_metadatas
+        
+    Raises:
+        ImportError: If numpy (the 'batch' extra) is not installed
+    """
+    np = _lazy.load_numpy()
+    
+    required = TechnicalRequirements.from_dict(requirements)
+    issues: List[List[Dict[str, Any]]] = [[] for _ in scene_metadatas]
+    
+    if scene_metadatas:
+        for prop, label, severity, tolerance in _TECHNICAL_CHECKS:
+            expected = getattr(required, prop)
+            if expected is None:
+                continue
+            
+            # Missing values are compared as zeros and then always reported as mismatches
+            actuals = [_technical_value(m, prop) for m in scene_metadatas]
+            missing = np.array([actual is None for actual in actuals])
+            
+            if prop == 'resolution':
+                sizes = np.array([actual or (0, 0) for actual in actuals], dtype=np.int64)
+                mismatches = (sizes != np.array(expected)).any(axis=1)
+            else:
+                values = np.array([actual or 0 for actual in actuals], dtype=np.float64)
+                mismatches = np.abs(values - expected) > tolerance if tolerance else values != expected
+            
+            for i in np.nonzero(mismatches | missing)[0]:
+                issues[i].append(_technical_issue(prop, label, severity, actuals[i], expected))
+    
+    return [
+        {
+            'passes': len(scene_issues) == 0,
+            'issues': scene_issues
+        } for scene_issues in issues
+    ]
+
+# Stored as the error of queued validations abandoned when their process stops
+_INTERRUPTED_ERROR = 'Validation interrupted by server shutdown; submit it again'
+
+class QueueFullError(RuntimeError):
+    """Raised when the background validation queue cannot accept more jobs."""
+
+# Callbacks are delivered in the background so slow receivers do not delay validations;
+# concurrent.futures joins the pool's threads at interpreter shutdown, flushing pending deliveries
+_CALLBACK_POOL = ThreadPoolExecutor(max_workers=16, thread_name_prefix='scene-callback')
+
+# Validation profiles keyed by profile ID; profiles change rarely
+_PROFILE_CACHE: TTLCache = TTLCache(maxsize=128, ttl=300)
+_PROFILE_CACHE_LOCK = threading.Lock()
+
+# Profiles missing from the cache are read from Firestore here while the media downloads
+_PROFILE_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix='scene-profile')
+
+# Content analyses keyed by content cache key, in front of the Firestore cache
+_CONTENT_CACHE: TTLCache = TTLCache(maxsize=1024, ttl=3600)
+_CONTENT_CACHE_LOCK = threading.Lock()
+
 class SceneValidator:
     """Main SceneValidator class for validating media scenes."""
     
@@ -23,7 +163,7 @@ class SceneValidator:
         """Initialize the SceneValidator.
         
         Args:
-            api_key: Gemini API key (overrides environment variable)
+            api_key: Gemini API key (overrides environment variable); one key is used per process
             config_path: Path to configuration file
         """
         self.config = load_config(config_path)
@@ -33,16 +173,32 @@ class SceneValidator:
         if not gemini_api_key:
             raise ValueError("Gemini API key is required. Provide it as a parameter or set GEMINI_API_KEY environment variable.")
         
-        genai.configure(api_key=gemini_api_key)
         self.model_name = self.config.get('GEMINI_MODEL', 'gemini-1.5-pro-latest')
-        self.model = genai.GenerativeModel(self.model_name)
+        self.model = clients.gemini(gemini_api_key, self.model_name)
         
-        # Initialize Google Cloud clients
-        self.storage_client = storage.Client()
-        self.db = firestore.Client()
+        # Use the process-wide Google Cloud clients
+        self.storage_client = clients.storage()
+        self.db = clients.firestore()
         
         # Initialize media processor
-        self.media_processor = MediaProcessor()
+        self.media_processor = MediaProcessor(storage_client=self.storage_client)
+        
+        # Background workers for queued validations
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.config['VALIDATION_WORKERS'],
+            thread_name_prefix='scene-validation'
+        )
+        
+        # Queued and running validations, bounded so that bursts are rejected instead of piling up in memory
+        self._max_pending = self.config['VALIDATION_WORKERS'] + self.config['VALIDATION_QUEUE_SIZE']
+        self._pending = 0
+        self._jobs: Dict[Future, Dict[str, Any]] = {}
+        self._jobs_lock = threading.Lock()
+        self._accepting = True
+        
+        # IDs of running validations that are writing their outcome, and of those shutdown gave up on
+        self._completing: Set[str] = set()
+        self._abandoned: Set[str] = set()
         
         logger.info(f"SceneValidator initialized with model {self.model_name}")
     
@@ -66,11 +222,153 @@ class SceneValidator:
         Returns:
             Dictionary containing validation results
         """
+        # Nobody can look this validation up until it returns, so its document
+        # is written once with the final outcome instead of being created up front
+        validation_doc = self._create_validation(
+            scene_id, media_url, validation_profile, metadata, technical_requirements, callback_url,
+            persist=False
+        )
+        
+        return self._run_validation(validation_doc, persisted=False)
+    
+    def submit(self, 
+              scene_id: str, 
+              media_url: str, 
+              validation_profile: str,
+              metadata: Dict[str, Any],
+              technical_requirements: Dict[str, Any],
+              callback_url: Optional[str] = None) -> Dict[str, Any]:
+        """Queue a media scene for validation in the background.
+        
+        The validation document is written with status 'in_progress' before
+        returning; results are stored in Firestore and sent to the callback
+        URL (if provided) once the validation completes.
+        
+        Args:
+            scene_id: Unique identifier for the scene
+            media_url: URL to the media file (GCS path or HTTP URL)
+            validation_profile: Name of the validation profile to use
+            metadata: Scene metadata (title, description, tags, etc.)
+            technical_requirements: Technical specifications for validation
+            callback_url: Optional URL to call when validation completes
+            
+        Returns:
+            Dictionary containing the validation ID and its initial status
+            
+        Raises:
+            ValueError: If the validation profile does not exist
+            QueueFullError: If the queue is full or the validator is shutting down
+        """
+        # Fail fast on unknown profiles instead of queueing a job that cannot succeed
+        self._get_validation_profile(validation_profile)
+        
+        with self._jobs_lock:
+            if not self._accepting:
+                raise QueueFullError("Validation service is shutting down")
+            if self._pending >= self._max_pending:
+                raise QueueFullError("Validation queue is full")
+            self._pending += 1
+        
+        try:
+            validation_doc = self._create_validation(
+                scene_id, media_url, validation_profile, metadata, technical_requirements, callback_url
+            )
+            
+            with self._jobs_lock:
+                future = self._executor.submit(self._run_validation, validation_doc) if self._accepting else None
+                if future is not None:
+                    self._jobs[future] = validation_doc
+        except BaseException:
+            with self._jobs_lock:
+                self._pending -= 1
+            raise
+        
+        if future is None:
+            # Shutdown started while the document was being written
+            with self._jobs_lock:
+                self._pending -= 1
+            self._store_validation_outcome(validation_doc, {'status': 'error', 'error': _INTERRUPTED_ERROR}, True)
+            raise QueueFullError("Validation service is shutting down")
+        
+        future.add_done_callback(self._finish_job)
+        logger.info(f"Queued validation {validation_doc['validation_id']} for scene {scene_id}")
+        
+        return {
+            'scene_id': scene_id,
+            'validation_id': validation_doc['validation_id'],
+            'timestamp': validation_doc['timestamp'],
+            'status': validation_doc['status']
+        }
+    
+    def shutdown(self, timeout: Optional[float] = None) -> None:
+        """Stop accepting validations and wait for queued ones to finish.
+        
+        Validations still unfinished after the timeout are given up on:
+        queued ones are cancelled and running ones will not store their
+        outcome, and their documents are marked as 'error' so that clients
+        polling them are not left waiting forever. Running validations that
+        are already storing their outcome are left to finish. Calling this
+        again has no effect.
+        
+        Args:
+            timeout: Seconds to wait for queued validations; None waits indefinitely
+        """
+        with self._jobs_lock:
+            if not self._accepting:
+                return
+            self._accepting = False
+            jobs = dict(self._jobs)
+        
+        logger.info(f"Shutting down with {len(jobs)} queued or running validations")
+        wait(jobs, timeout=timeout)
+        
+        # Cancelling drops queued jobs from self._jobs, so work from the snapshot
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        
+        abandoned = []
+        with self._jobs_lock:
+            for future, validation_doc in jobs.items():
+                validation_id = validation_doc['validation_id']
+                if future.cancelled() or not (future.done() or validation_id in self._completing):
+                    self._abandoned.add(validation_id)
+                    abandoned.append(validation_doc)
+        
+        for validation_doc in abandoned:
+            logger.warning(f"Abandoning validation {validation_doc['validation_id']} on shutdown")
+            try:
+                self._store_validation_outcome(validation_doc, {'status': 'error', 'error': _INTERRUPTED_ERROR}, True)
+            except Exception as e:
+                logger.error(f"Failed to mark validation {validation_doc['validation_id']} as interrupted: {str(e)}")
+    
+    def _finish_job(self, future: Future) -> None:
+        """Release the queue slot of a finished or cancelled validation."""
+        with self._jobs_lock:
+            validation_doc = self._jobs.pop(future, None)
+            self._pending -= 1
+            if validation_doc is not None:
+                self._completing.discard(validation_doc['validation_id'])
+                self._abandoned.discard(validation_doc['validation_id'])
+    
+    def _claim_outcome(self, validation_id: str) -> bool:
+        """Reserve the right to store a queued validation's outcome, unless shutdown already gave up on it."""
+        with self._jobs_lock:
+            if validation_id in self._abandoned:
+                return False
+            self._completing.add(validation_id)
+            return True
+    
+    def _create_validation(self, 
+                          scene_id: str, 
+                          media_url: str, 
+                          validation_profile: str,
+                          metadata: Dict[str, Any],
+                          technical_requirements: Dict[str, Any],
+                          callback_url: Optional[str],
+                          persist: bool = True) -> Dict[str, Any]:
+        """Build a new validation job document, recording it in Firestore if persist is set."""
         validation_id = str(uuid.uuid4())
         timestamp = datetime.utcnow().isoformat() + 'Z'
         
-        logger.info(f"Starting validation {validation_id} for scene {scene_id}")
-        
         # Record the validation job
         validation_doc = {
             'validation_id': validation_id,
@@ -84,30 +382,79 @@ class SceneValidator:
             'callback_url': callback_url
         }
         
-        self.db.collection(self.config['FIRESTORE_COLLECTION_VALIDATIONS']).document(validation_id).set(validation_doc)
+        if persist:
+            self.db.collection(self.config['FIRESTORE_COLLECTION_VALIDATIONS']).document(validation_id).set(validation_doc)
+        
+        return validation_doc
+    
+    def _store_validation_outcome(self, 
+                                 validation_doc: Dict[str, Any], 
+                                 fields: Dict[str, Any],
+                                 persisted: bool) -> None:
+        """Write the outcome of a validation job with a single Firestore call."""
+        doc_ref = self.db.collection(self.config['FIRESTORE_COLLECTION_VALIDATIONS']).document(validation_doc['validation_id'])
+        
+        if persisted:
+            doc_ref.update(fields)
+        else:
+            doc_ref.set({**validation_doc, **fields})
+    
+    def _run_validation(self, validation_doc: Dict[str, Any], persisted: bool = True) -> Dict[str, Any]:
+        """Run a validation job and store its outcome.
+        
+        Args:
+            validation_doc: Validation job document from _create_validation
+            persisted: Whether the job document was already written to Firestore
+            
+        Returns:
+            Dictionary containing validation results
+        """
+        validation_id = validation_doc['validation_id']
+        scene_id = validation_doc['scene_id']
+        timestamp = validation_doc['timestamp']
+        media_url = validation_doc['media_url']
+        validation_profile = validation_doc['validation_profile']
+        metadata = validation_doc['metadata']
+        technical_requirements = validation_doc['technical_requirements']
+        callback_url = validation_doc['callback_url']
+        
+        logger.info(f"Starting validation {validation_id} for scene {scene_id}")
         
         try:
-            # 1. Load the validation profile
-            profile = self._get_validation_profile(validation_profile)
+            # 1. Start loading the validation profile, so an uncached one is read while the media downloads
+            profile_future = self._prefetch_validation_profile(validation_profile)
             
-            # 2. Validate technical specifications
-            technical_validation = self._validate_technical_specs(media_url, technical_requirements)
+            # 2. Download the media once and extract everything both validation stages need
+            local_path = self.media_processor.download_media(media_url)
+            try:
+                tech_metadata = self.media_processor.extract_metadata(local_path)
+                frames = self.media_processor.extract_key_frames(local_path, tech_metadata['duration'], 5)  # Extract 5 key frames
+            finally:
+                self.media_processor.cleanup(local_path)
+            
+            if profile_future is not None:
+                profile = profile_future.result()
+            else:
+                profile = self._get_validation_profile(validation_profile)
             
             # 3. Validate content using Gemini API
-            content_validation = self._validate_content(media_url, metadata, profile)
+            content_validation = self._validate_content(frames, metadata, profile)
             
-            # 4. Generate recommendations
+            # 4. Validate technical specifications
+            technical_validation = self._validate_technical_specs(tech_metadata, technical_requirements)
+            
+            # 5. Generate recommendations
             recommendations = self._generate_recommendations(
                 technical_validation['issues'] + content_validation['issues'], 
                 profile
             )
             
-            # 5. Compile results
+            # 6. Compile results
             validation_passes = technical_validation['passes'] and content_validation['passes']
             status = 'passed' if validation_passes else 'failed'
             summary = self._generate_summary(technical_validation, content_validation, recommendations)
             
-            # 6. Create result
+            # 7. Create result
             result = {
                 'scene_id': scene_id,
                 'validation_id': validation_id,
@@ -119,28 +466,28 @@ class SceneValidator:
                 'recommendations': recommendations
             }
             
-            # 7. Update validation document
-            self.db.collection(self.config['FIRESTORE_COLLECTION_VALIDATIONS']).document(validation_id).update({
+            # 8. Update validation document, unless shutdown already marked it as interrupted
+            if persisted and not self._claim_outcome(validation_id):
+                logger.warning(f"Discarding result of abandoned validation {validation_id}")
+                return result
+            
+            self._store_validation_outcome(validation_doc, {
                 'status': status,
                 'result': result
-            })
-            
-            # 8. Send callback if provided
-            if callback_url:
-                self._send_callback(callback_url, result)
-                
-            logger.info(f"Completed validation {validation_id} with status {status}")
-            return result
+            }, persisted)
             
         except Exception as e:
             error_message = f"Validation failed: {str(e)}"
             logger.error(error_message, exc_info=True)
             
+            if persisted and not self._claim_outcome(validation_id):
+                raise
+            
             # Update validation document with error
-            self.db.collection(self.config['FIRESTORE_COLLECTION_VALIDATIONS']).document(validation_id).update({
+            self._store_validation_outcome(validation_doc, {
                 'status': 'error',
                 'error': error_message
-            })
+            }, persisted)
             
             # Send error callback if provided
             if callback_url:
@@ -153,85 +500,74 @@ class SceneValidator:
                 })
                 
             raise
+        
+        # 9. Send callback if provided, once the outcome is stored so delivery problems cannot change it
+        if callback_url:
+            self._send_callback(callback_url, result)
+            
+        logger.info(f"Completed validation {validation_id} with status {status}")
+        return result
     
     def _get_validation_profile(self, profile_id: str) -> Dict[str, Any]:
-        """Load a validation profile from Firestore."""
+        """Load a validation profile from Firestore, using the in-process cache when possible."""
+        with _PROFILE_CACHE_LOCK:
+            profile = _PROFILE_CACHE.get(profile_id)
+        
+        if profile is not None:
+            return profile
+        
         profile_doc = self.db.collection(self.config['FIRESTORE_COLLECTION_PROFILES']).document(profile_id).get()
         
         if not profile_doc.exists:
             raise ValueError(f"Validation profile '{profile_id}' not found")
+        
+        profile = profile_doc.to_dict()
+        with _PROFILE_CACHE_LOCK:
+            _PROFILE_CACHE[profile_id] = profile
             
-        return profile_doc.to_dict()
+        return profile
     
-    def _validate_technical_specs(self, media_url: str, requirements: Dict[str, Any]) -> Dict[str, Any]:
-        """Validate the technical specifications of the media file."""
-        logger.info(f"Validating technical specifications for {media_url}")
+    def _prefetch_validation_profile(self, profile_id: str) -> Optional[Future]:
+        """Start loading a validation profile that is not cached; returns None if it is cached or cannot be scheduled."""
+        with _PROFILE_CACHE_LOCK:
+            if profile_id in _PROFILE_CACHE:
+                return None
         
-        # Download media file if needed
-        local_path = self.media_processor.download_media(media_url)
+        try:
+            return _PROFILE_POOL.submit(self._get_validation_profile, profile_id)
+        except RuntimeError:
+            # The pool refuses new work once the interpreter is shutting down; load the profile inline instead
+            return None
+    
+    def _validate_technical_specs(self, tech_metadata: Dict[str, Any], requirements: Dict[str, Any]) -> Dict[str, Any]:
+        """Validate the technical metadata of the media file against requirements."""
+        logger.info("Validating technical specifications")
         
-        # Extract technical metadata
-        tech_metadata = self.media_processor.extract_metadata(local_path)
+        required = TechnicalRequirements.from_dict(requirements)
         
-        # Compare with requirements
+        # Compare with requirements; a missing value never meets its requirement
         issues = []
-        
-        # Check resolution
-        if 'resolution' in requirements:
-            req_width, req_height = map(int, requirements['resolution'].split('x'))
-            if tech_metadata['width'] != req_width or tech_metadata['height'] != req_height:
-                issues.append({
-                    'type': 'resolution_mismatch',
-                    'description': f"Resolution {tech_metadata['width']}x{tech_metadata['height']} does not match required {requirements['resolution']}",
-                    'severity': 'high',
-                    'property': 'resolution'
-                })
-        
-        # Check framerate
-        if 'framerate' in requirements:
-            if abs(tech_metadata['framerate'] - requirements['framerate']) > 0.01:  # Allow small tolerance
-                issues.append({
-                    'type': 'framerate_mismatch',
-                    'description': f"Framerate {tech_metadata['framerate']} does not match required {requirements['framerate']}",
-                    'severity': 'high',
-                    'property': 'framerate'
-                })
-        
-        # Check audio channels
-        if 'audio_channels' in requirements:
-            if tech_metadata['audio_channels'] != requirements['audio_channels']:
-                issues.append({
-                    'type': 'audio_channels_mismatch',
-                    'description': f"Audio channels {tech_metadata['audio_channels']} does not match required {requirements['audio_channels']}",
-                    'severity': 'medium',
-                    'property': 'audio_channels'
-                })
-        
-        # Check audio sample rate
-        if 'audio_sample_rate' in requirements:
-            if tech_metadata['audio_sample_rate'] != requirements['audio_sample_rate']:
-                issues.append({
-                    'type': 'audio_sample_rate_mismatch',
-                    'description': f"Audio sample rate {tech_metadata['audio_sample_rate']} does not match required {requirements['audio_sample_rate']}",
-                    'severity': 'medium',
-                    'property': 'audio_sample_rate'
-                })
-        
-        # Clean up downloaded file
-        self.media_processor.cleanup(local_path)
+        for prop, label, severity, tolerance in _TECHNICAL_CHECKS:
+            expected = getattr(required, prop)
+            if expected is None:
+                continue
+            
+            actual = _technical_value(tech_metadata, prop)
+            if actual is None:
+                mismatch = True
+            else:
+                mismatch = abs(actual - expected) > tolerance if tolerance else actual != expected
+            if mismatch:
+                issues.append(_technical_issue(prop, label, severity, actual, expected))
         
         return {
             'passes': len(issues) == 0,
             'issues': issues
         }
     
-    def _validate_content(self, media_url: str, metadata: Dict[str, Any], profile: Dict[str, Any]) -> Dict[str, Any]:
-        """Validate content using Gemini API."""
-        logger.info(f"Validating content for {media_url}")
-        
-        # Extract frames for analysis
-        local_path = self.media_processor.download_media(media_url)
-        frames = self.media_processor.extract_key_frames(local_path, 5)  # Extract 5 key frames
+    def _validate_content(self, frames: List[bytes], metadata: Dict[str, Any], profile: Dict[str, Any]) -> Dict[str, Any]:
+        """Validate content of the extracted key frames using Gemini API."""
+        logger.info(f"Validating content of {len(frames)} key frames")
         
         issues = []
         
@@ -246,7 +582,7 @@ class SceneValidator:
         Content Rating: {metadata.get('content_rating', 'Unknown')}
         
         Validation criteria from profile '{profile.get('name', 'Unknown')}':
-        {json.dumps(profile.get('content_criteria', {}), indent=2)}
+        {orjson.dumps(profile.get('content_criteria', {}), option=orjson.OPT_INDENT_2).decode()}
         
         Identify any content issues according to these criteria. For each issue, provide:
         1. Issue type (exact match from criteria categories)
@@ -257,41 +593,93 @@ class SceneValidator:
         Format your response as a JSON list of issues, or an empty list if no issues found.
         """
         
-        # Call Gemini API with frames
-        response = self.model.generate_content(
-            contents=[prompt] + [{'inline_data': {'mime_type': 'image/jpeg', 'data': frame}} for frame in frames]
-        )
+        # Reuse a previous analysis of the same frames and prompt if there is one
+        cache_key = self._content_cache_key(prompt, frames)
+        cached_issues = self._get_cached_content_issues(cache_key)
         
-        # Parse response to extract issues
-        try:
-            response_text = response.text
-            # Extract JSON array from response (it might be wrapped in markdown code blocks)
-            if '```json' in response_text:
-                json_str = response_text.split('```json')[1].split('```')[0].strip()
-            elif '```' in response_text:
-                json_str = response_text.split('```')[1].split('```')[0].strip()
+        if cached_issues is not None:
+            logger.info(f"Using cached content analysis {cache_key}")
+            issues.extend(cached_issues)
+        else:
+            # Call Gemini API with frames
+            with limits.outbound:
+                response = self.model.generate_content(
+                    contents=[prompt] + [{'inline_data': {'mime_type': 'image/jpeg', 'data': frame}} for frame in frames]
+                )
+            
+            # Parse response to extract issues
+            try:
+                # Extract JSON array from response (it might be wrapped in markdown code blocks)
+                gemini_issues = _extract_json(response.text)
+                issues.extend(gemini_issues)
+            except Exception as e:
+                logger.error(f"Failed to parse Gemini response: {str(e)}")
+                issues.append({
+                    'type': 'validation_error',
+                    'description': f"Failed to analyze content: {str(e)}",
+                    'severity': 'high',
+                    'timecode': 'N/A'
+                })
             else:
-                json_str = response_text.strip()
-                
-            gemini_issues = json.loads(json_str)
-            issues.extend(gemini_issues)
-        except Exception as e:
-            logger.error(f"Failed to parse Gemini response: {str(e)}")
-            issues.append({
-                'type': 'validation_error',
-                'description': f"Failed to analyze content: {str(e)}",
-                'severity': 'high',
-                'timecode': 'N/A'
-            })
-        
-        # Clean up
-        self.media_processor.cleanup(local_path)
+                self._cache_content_issues(cache_key, gemini_issues)
         
         return {
             'passes': len(issues) == 0,
             'issues': issues
         }
     
+    def _content_cache_key(self, prompt: str, frames: List[bytes]) -> str:
+        """Compute the cache key for a content analysis from the model, prompt and frames."""
+        digest = hashlib.blake2b(digest_size=32)
+        digest.update(self.model_name.encode())
+        digest.update(prompt.encode())
+        for frame in frames:
+            digest.update(frame)
+        return digest.hexdigest()
+    
+    def _get_cached_content_issues(self, cache_key: str) -> Optional[List[Dict[str, Any]]]:
+        """Load cached content issues, checking the in-process cache before Firestore."""
+        with _CONTENT_CACHE_LOCK:
+            issues = _CONTENT_CACHE.get(cache_key)
+        
+        if issues is not None:
+            return issues
+        
+        try:
+            cache_doc = self.db.collection(self.config['FIRESTORE_COLLECTION_GEMINI_CACHE']).document(cache_key).get()
+        except Exception as e:
+            logger.warning(f"Failed to read content analysis cache {cache_key}: {str(e)}")
+            return None
+        
+        if not cache_doc.exists:
+            return None
+        
+        entry = cache_doc.to_dict()
+        max_age = timedelta(days=self.config['GEMINI_CACHE_TTL_DAYS'])
+        created_at = entry.get('created_at')
+        if created_at is None or datetime.now(timezone.utc) - created_at > max_age:
+            return None
+        
+        issues = entry.get('issues', [])
+        with _CONTENT_CACHE_LOCK:
+            _CONTENT_CACHE[cache_key] = issues
+        
+        return issues
+    
+    def _cache_content_issues(self, cache_key: str, issues: List[Dict[str, Any]]) -> None:
+        """Store content issues returned by Gemini in the in-process and Firestore caches."""
+        with _CONTENT_CACHE_LOCK:
+            _CONTENT_CACHE[cache_key] = issues
+        
+        try:
+            self.db.collection(self.config['FIRESTORE_COLLECTION_GEMINI_CACHE']).document(cache_key).set({
+                'issues': issues,
+                'model': self.model_name,
+                'created_at': datetime.now(timezone.utc)
+            })
+        except Exception as e:
+            logger.warning(f"Failed to write content analysis cache {cache_key}: {str(e)}")
+    
     def _generate_recommendations(self, issues: List[Dict[str, Any]], profile: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Generate recommendations for identified issues."""
         if not issues:
@@ -300,7 +688,7 @@ class SceneValidator:
         recommendations = []
         
         # Create a prompt for Gemini API to generate recommendations
-        issues_json = json.dumps(issues, indent=2)
+        issues_json = orjson.dumps(issues, option=orjson.OPT_INDENT_2).decode()
         prompt = f"""
         You are a media optimization expert. Review these issues found in a media scene validation:
         
@@ -308,7 +696,7 @@ class SceneValidator:
         
         For each issue, provide a specific recommendation to fix the problem. Consider the following profile requirements:
         
-        {json.dumps(profile, indent=2)}
+        {orjson.dumps(profile, option=orjson.OPT_INDENT_2).decode()}
         
         Format your response as a JSON array of recommendations, where each recommendation contains:
         1. issue_id: The index of the issue in the provided list (0, 1, 2, etc.)
@@ -316,18 +704,11 @@ class SceneValidator:
         """
         
         try:
-            response = self.model.generate_content(prompt)
+            with limits.outbound:
+                response = self.model.generate_content(prompt)
             
             # Parse response to extract recommendations
-            response_text = response.text
-            if '```json' in response_text:
-                json_str = response_text.split('```json')[1].split('```')[0].strip()
-            elif '```' in response_text:
-                json_str = response_text.split('```')[1].split('```')[0].strip()
-            else:
-                json_str = response_text.strip()
-                
-            recommendations = json.loads(json_str)
+            recommendations = _extract_json(response.text)
         except Exception as e:
             logger.error(f"Failed to generate recommendations: {str(e)}")
             recommendations = [
@@ -372,13 +753,22 @@ class SceneValidator:
         return summary
     
     def _send_callback(self, callback_url: str, data: Dict[str, Any]) -> None:
-        """Send validation results to the callback URL."""
+        """Send validation results to the callback URL without waiting for delivery."""
         try:
-            response = requests.post(
-                callback_url,
-                json=data,
-                headers={'Content-Type': 'application/json'}
-            )
+            _CALLBACK_POOL.submit(self._deliver_callback, callback_url, data)
+        except RuntimeError as e:
+            # The pool refuses new work once the interpreter is shutting down
+            logger.error(f"Failed to queue callback to {callback_url}: {str(e)}")
+    
+    def _deliver_callback(self, callback_url: str, data: Dict[str, Any]) -> None:
+        """POST validation results to the callback URL."""
+        try:
+            with limits.outbound:
+                response = get_client().post(
+                    callback_url,
+                    content=orjson.dumps(data),
+                    headers={'Content-Type': 'application/json'}
+                )
             response.raise_for_status()
             logger.info(f"Callback sent successfully to {callback_url}")
         except Exception as e:
@@ -0,0 +1,23 @@
+"""WSGI entry point for serving SceneValidator in production.
+
+Run with gunicorn using the packaged configuration, e.g.:
+
+    gunicorn -c python:scene_validator.gunicorn_conf scene_validator.wsgi:app
+"""
+
+import sys
+
+# Only gevent workers import gevent.monkey; checking sys.modules avoids importing gevent otherwise
+if 'gevent.monkey' in sys.modules and sys.modules['gevent.monkey'].is_module_patched('socket'):
+    try:
+        # gRPC (used by the Firestore client) must cooperate with gevent's event loop
+        from grpc.experimental import gevent as grpc_gevent
+    except ImportError:  # grpc is installed with the gcp extra
+        grpc_gevent = None
+    
+    if grpc_gevent is not None:
+        grpc_gevent.init_gevent()
+
+from .api.server import app
+
+__all__ = ['app']
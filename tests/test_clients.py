@@ -0,0 +1,35 @@
+"""Tests for the shared Gemini models in scene_validator.clients."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from scene_validator import clients
+
+@pytest.fixture
+def genai(monkeypatch):
+    """Replace google.generativeai with a stub recording configure() calls."""
+    configured = []
+    stub = SimpleNamespace(
+        configure=lambda api_key: configured.append(api_key),
+        GenerativeModel=lambda model_name: SimpleNamespace(model_name=model_name),
+        configured=configured,
+    )
+    monkeypatch.setattr(clients._lazy, 'load_genai', lambda: stub)
+    monkeypatch.setattr(clients, '_gemini_api_key', None)
+    monkeypatch.setattr(clients, '_gemini_models', {})
+    return stub
+
+def test_gemini_reuses_models_per_name(genai):
+    model = clients.gemini('key-1', 'gemini-pro')
+    
+    assert clients.gemini('key-1', 'gemini-pro') is model
+    assert clients.gemini('key-1', 'gemini-flash') is not model
+    assert genai.configured == ['key-1']
+
+def test_gemini_rejects_a_second_api_key(genai):
+    clients.gemini('key-1', 'gemini-pro')
+    
+    with pytest.raises(ValueError):
+        clients.gemini('key-2', 'gemini-pro')
+    assert genai.configured == ['key-1']
@@ -0,0 +1,48 @@
+"""Tests for scene_validator.utils.media."""
+
+import shutil
+import subprocess
+
+import pytest
+
+from scene_validator.utils.media import MediaProcessor, _split_jpeg_stream
+
+def _jpeg(payload: bytes) -> bytes:
+    """Build a minimal JPEG-like image: SOI, APP0 marker, payload and EOI."""
+    return b'\xff\xd8\xff\xe0' + payload + b'\xff\xd9'
+
+def test_split_jpeg_stream_splits_concatenated_images():
+    images = [_jpeg(b'first'), _jpeg(b'second \xff\xd8 not a marker'), _jpeg(b'third')]
+    
+    assert _split_jpeg_stream(b''.join(images)) == images
+
+def test_split_jpeg_stream_single_image():
+    image = _jpeg(b'only')
+    
+    assert _split_jpeg_stream(image) == [image]
+
+def test_split_jpeg_stream_skips_leading_bytes():
+    image = _jpeg(b'frame')
+    
+    assert _split_jpeg_stream(b'garbage' + image) == [image]
+
+def test_split_jpeg_stream_empty():
+    assert _split_jpeg_stream(b'') == []
+    assert _split_jpeg_stream(b'no images here') == []
+
+@pytest.mark.skipif(
+    shutil.which('ffmpeg') is None or shutil.which('ffprobe') is None,
+    reason='ffmpeg is not installed'
+)
+def test_extract_key_frames_returns_one_frame_per_timestamp(tmp_path):
+    clip = tmp_path / 'clip.mp4'
+    subprocess.run(
+        ['ffmpeg', '-loglevel', 'error', '-f', 'lavfi', '-i', 'testsrc=duration=12:size=640x360:rate=25',
+         '-pix_fmt', 'yuv420p', str(clip)],
+        check=True
+    )
+    
+    frames = MediaProcessor(storage_client=object()).extract_key_frames(str(clip), 12.0, 5)
+    
+    assert len(frames) == 5
+    assert all(frame.startswith(b'\xff\xd8\xff') and frame.endswith(b'\xff\xd9') for frame in frames)
@@ -0,0 +1,105 @@
+"""Tests for the JWT handling and endpoints in scene_validator.api.server."""
+
+import time
+
+import jwt
+import pytest
+
+from scene_validator.api import server
+
+SECRET_KEY = 'test-secret-key-of-at-least-32-bytes'
+
+@pytest.fixture(autouse=True)
+def clear_jwt_cache(monkeypatch):
+    monkeypatch.setitem(server.app.config, 'SECRET_KEY', SECRET_KEY)
+    with server._JWT_CACHE_LOCK:
+        server._JWT_CACHE.clear()
+    yield
+    with server._JWT_CACHE_LOCK:
+        server._JWT_CACHE.clear()
+
+def _token(**claims) -> str:
+    return jwt.encode({'user_id': 'user-1', **claims}, SECRET_KEY, algorithm='HS256')
+
+def test_decode_token_verifies_each_token_once(monkeypatch):
+    token = _token(exp=int(time.time()) + 600)
+    calls = []
+    decode = jwt.decode
+    
+    def counting_decode(*args, **kwargs):
+        calls.append(args)
+        return decode(*args, **kwargs)
+    
+    monkeypatch.setattr(server.jwt, 'decode', counting_decode)
+    
+    assert server._decode_token(token)['user_id'] == 'user-1'
+    assert server._decode_token(token)['user_id'] == 'user-1'
+    assert len(calls) == 1
+
+def test_decode_token_rejects_cached_token_after_expiry(monkeypatch):
+    expires_at = int(time.time()) + 60
+    token = _token(exp=expires_at)
+    server._decode_token(token)
+    
+    monkeypatch.setattr(server.time, 'time', lambda: expires_at + 1)
+    
+    with pytest.raises(jwt.ExpiredSignatureError):
+        server._decode_token(token)
+    with server._JWT_CACHE_LOCK:
+        assert len(server._JWT_CACHE) == 0
+
+def test_decode_token_without_expiry_stays_cached(monkeypatch):
+    token = _token()
+    server._decode_token(token)
+    
+    monkeypatch.setattr(server.time, 'time', lambda: time.time() + 10 ** 6)
+    
+    assert server._decode_token(token)['user_id'] == 'user-1'
+
+def test_decode_token_does_not_cache_invalid_tokens():
+    token = jwt.encode({'user_id': 'user-1'}, 'another-secret-key-of-at-least-32-bytes', algorithm='HS256')
+    
+    with pytest.raises(jwt.InvalidSignatureError):
+        server._decode_token(token)
+    with server._JWT_CACHE_LOCK:
+        assert len(server._JWT_CACHE) == 0
+
+VALIDATION_REQUEST = {
+    'scene_id': 'scene-1',
+    'media_url': 'https://example.com/media.mp4',
+    'validation_profile': 'profile',
+    'metadata': {},
+    'technical_requirements': {}
+}
+
+def _post_validation():
+    return server.app.test_client().post(
+        '/validate',
+        headers={'Authorization': f"Bearer {_token(exp=int(time.time()) + 600)}"},
+        json=VALIDATION_REQUEST
+    )
+
+def test_validate_returns_503_when_validator_cannot_be_created(monkeypatch):
+    def misconfigured_validator():
+        raise ValueError('Gemini API key is required')
+    
+    monkeypatch.setattr(server, '_validator', None)
+    monkeypatch.setattr(server, 'SceneValidator', misconfigured_validator)
+    
+    response = _post_validation()
+    
+    assert response.status_code == 503
+    assert response.json == {'error': 'Validation service unavailable'}
+
+def test_validate_returns_503_when_queue_is_full(monkeypatch):
+    class FullValidator:
+        def submit(self, **kwargs):
+            raise server.QueueFullError('Validation queue is full')
+    
+    monkeypatch.setattr(server, '_validator', FullValidator())
+    
+    response = _post_validation()
+    
+    assert response.status_code == 503
+    assert response.headers['Retry-After'] == '30'
+    assert response.json == {'error': 'Validation queue is full'}
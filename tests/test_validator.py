@@ -0,0 +1,203 @@
+"""Tests for the technical validation in scene_validator.validator."""
+
+import threading
+from concurrent.futures import wait
+
+import pytest
+
+from scene_validator import clients
+from scene_validator.validator import _INTERRUPTED_ERROR, QueueFullError, SceneValidator, validate_batch
+
+REQUIREMENTS = {
+    'resolution': '1920x1080',
+    'framerate': 29.97,
+    'audio_channels': 2,
+    'audio_sample_rate': 48000,
+}
+
+SCENES = [
+    # Meets every requirement
+    {'width': 1920, 'height': 1080, 'framerate': 29.97, 'audio_channels': 2, 'audio_sample_rate': 48000},
+    # Framerate within tolerance
+    {'width': 1920, 'height': 1080, 'framerate': 29.975, 'audio_channels': 2, 'audio_sample_rate': 48000},
+    # Fails every check
+    {'width': 1280, 'height': 720, 'framerate': 25.0, 'audio_channels': 6, 'audio_sample_rate': 44100},
+    # Only the height differs
+    {'width': 1920, 'height': 1088, 'framerate': 29.97, 'audio_channels': 2, 'audio_sample_rate': 48000},
+    # Missing fields
+    {'width': 1920, 'framerate': 29.97, 'audio_channels': 2},
+    {},
+]
+
+def _validate_single(tech_metadata, requirements):
+    """Run the per-scene technical validation, which does not touch any clients."""
+    return SceneValidator._validate_technical_specs(object.__new__(SceneValidator), tech_metadata, requirements)
+
+@pytest.mark.parametrize('requirements', [
+    REQUIREMENTS,
+    {'resolution': '1920x1080'},
+    {'framerate': 29.97, 'audio_sample_rate': 48000},
+    {},
+])
+def test_validate_batch_matches_single_scene_validation(requirements):
+    expected = [_validate_single(scene, requirements) for scene in SCENES]
+    
+    assert validate_batch(SCENES, requirements) == expected
+
+def test_validate_batch_reports_each_failed_check():
+    results = validate_batch(SCENES, REQUIREMENTS)
+    
+    assert [result['passes'] for result in results] == [True, True, False, False, False, False]
+    assert [issue['property'] for issue in results[2]['issues']] == [
+        'resolution', 'framerate', 'audio_channels', 'audio_sample_rate'
+    ]
+    assert [issue['property'] for issue in results[3]['issues']] == ['resolution']
+    assert [issue['property'] for issue in results[4]['issues']] == ['resolution', 'audio_sample_rate']
+    assert results[4]['issues'][0]['description'] == 'Resolution unknown does not match required 1920x1080'
+
+def test_validate_batch_empty():
+    assert validate_batch([], REQUIREMENTS) == []
+
+class FakeDocument:
+    """Firestore document reference writing into a plain dict."""
+    
+    def __init__(self, documents, doc_id):
+        self.documents = documents
+        self.doc_id = doc_id
+    
+    def set(self, data):
+        self.documents[self.doc_id] = dict(data)
+    
+    def update(self, fields):
+        self.documents[self.doc_id].update(fields)
+
+class FakeFirestore:
+    """Firestore client keeping all documents in one dict keyed by document ID."""
+    
+    def __init__(self):
+        self.documents = {}
+    
+    def collection(self, name):
+        return self
+    
+    def document(self, doc_id):
+        return FakeDocument(self.documents, doc_id)
+
+@pytest.fixture
+def queue(monkeypatch):
+    """SceneValidator with one worker and one queue slot, whose media downloads block until released."""
+    monkeypatch.setenv('VALIDATION_WORKERS', '1')
+    monkeypatch.setenv('VALIDATION_QUEUE_SIZE', '1')
+    db = FakeFirestore()
+    monkeypatch.setattr(clients, 'gemini', lambda api_key, model_name: object())
+    monkeypatch.setattr(clients, 'storage', lambda: object())
+    monkeypatch.setattr(clients, 'firestore', lambda: db)
+    
+    validator = SceneValidator(api_key='test-key')
+    started = threading.Event()
+    release = threading.Event()
+    
+    def download_media(media_url):
+        started.set()
+        release.wait(5)
+        return '/nonexistent/media.mp4'
+    
+    monkeypatch.setattr(validator.media_processor, 'download_media', download_media)
+    monkeypatch.setattr(validator.media_processor, 'extract_metadata', lambda path: {**SCENES[0], 'duration': 10.0})
+    monkeypatch.setattr(validator.media_processor, 'extract_key_frames', lambda path, duration, num_frames: [])
+    monkeypatch.setattr(validator, '_get_validation_profile', lambda profile_id: {'name': profile_id})
+    monkeypatch.setattr(validator, '_validate_content', lambda frames, metadata, profile: {'passes': True, 'issues': []})
+    
+    yield validator, db, started, release
+    
+    release.set()
+    validator._executor.shutdown(wait=True)
+
+def _submit(validator):
+    return validator.submit('scene-1', 'https://example.com/media.mp4', 'profile', {}, REQUIREMENTS)
+
+def test_submit_queues_validation_and_stores_result(queue):
+    validator, db, started, release = queue
+    
+    job = _submit(validator)
+    
+    assert job['status'] == 'in_progress'
+    assert db.documents[job['validation_id']]['status'] == 'in_progress'
+    
+    futures = list(validator._jobs)
+    release.set()
+    wait(futures, timeout=5)
+    
+    assert db.documents[job['validation_id']]['status'] == 'passed'
+    assert validator._pending == 0
+
+def test_submit_rejects_jobs_beyond_the_queue_bound(queue):
+    validator, db, started, release = queue
+    
+    _submit(validator)
+    _submit(validator)
+    with pytest.raises(QueueFullError):
+        _submit(validator)
+    assert len(db.documents) == 2
+    
+    futures = list(validator._jobs)
+    release.set()
+    wait(futures, timeout=5)
+    
+    assert _submit(validator)['status'] == 'in_progress'
+
+def test_shutdown_waits_for_queued_validations(queue):
+    validator, db, started, release = queue
+    job = _submit(validator)
+    threading.Timer(0.1, release.set).start()
+    
+    validator.shutdown(timeout=5)
+    
+    assert db.documents[job['validation_id']]['status'] == 'passed'
+
+def test_shutdown_marks_unfinished_validations_and_discards_late_results(queue):
+    validator, db, started, release = queue
+    running = _submit(validator)
+    queued = _submit(validator)
+    started.wait(5)
+    futures = list(validator._jobs)
+    
+    validator.shutdown(timeout=0)
+    
+    for job in (running, queued):
+        assert db.documents[job['validation_id']]['status'] == 'error'
+        assert db.documents[job['validation_id']]['error'] == _INTERRUPTED_ERROR
+    
+    # The running validation finishes after being abandoned and must not overwrite the error
+    release.set()
+    wait([future for future in futures if not future.cancelled()], timeout=5)
+    
+    assert db.documents[running['validation_id']]['status'] == 'error'
+
+def test_submit_after_shutdown_is_rejected(queue):
+    validator, db, started, release = queue
+    validator.shutdown(timeout=0)
+    
+    with pytest.raises(QueueFullError):
+        _submit(validator)
+    assert db.documents == {}
+
+def test_uncached_profile_is_loaded_while_media_downloads(queue, monkeypatch):
+    validator, db, started, release = queue
+    profile_loaded = threading.Event()
+    
+    def get_validation_profile(profile_id):
+        profile_loaded.set()
+        return {'name': profile_id}
+    
+    def download_media(media_url):
+        # Only returns once the profile lookup has run alongside the download
+        assert profile_loaded.wait(5)
+        return '/nonexistent/media.mp4'
+    
+    monkeypatch.setattr(validator, '_get_validation_profile', get_validation_profile)
+    monkeypatch.setattr(validator.media_processor, 'download_media', download_media)
+    
+    result = validator.validate('scene-1', 'https://example.com/media.mp4', 'uncached-profile', {}, REQUIREMENTS)
+    
+    assert result['status'] == 'passed'